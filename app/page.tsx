@@ -49,12 +49,19 @@ export default async function HomePage({
     return dateB - dateA;
   });
 
-  const allTags = [
-    "All",
-    ...Array.from(
-      new Set(sortedBlogs.flatMap((blog) => blog.data.tags || []))
-    ).sort(),
-  ];
+  const postsPerTag = new Map<string, number>();
+  for (const blog of sortedBlogs) {
+    for (const tag of new Set(blog.data.tags || [])) {
+      postsPerTag.set(tag, (postsPerTag.get(tag) ?? 0) + 1);
+    }
+  }
+
+  const allTags = ["All", ...Array.from(postsPerTag.keys()).sort()];
+
+  const tagCounts: Record<string, number> = {
+    ...Object.fromEntries(postsPerTag),
+    All: sortedBlogs.length,
+  };
 
   const selectedTag = resolvedSearchParams.tag || "All";
   const filteredBlogs =
@@ -62,17 +69,6 @@ export default async function HomePage({
       ? sortedBlogs
       : sortedBlogs.filter((blog) => blog.data.tags?.includes(selectedTag));
 
-  const tagCounts = allTags.reduce((acc, tag) => {
-    if (tag === "All") {
-      acc[tag] = sortedBlogs.length;
-    } else {
-      acc[tag] = sortedBlogs.filter((blog) =>
-        blog.data.tags?.includes(tag)
-      ).length;
-    }
-    return acc;
-  }, {} as Record<string, number>);
-
   return (
     <div className="min-h-screen bg-background relative">
       <div className="absolute top-0 left-0 z-0 w-full h-[200px] [mask-image:linear-gradient(to_top,transparent_25%,black_95%)]">